@@ -2,6 +2,7 @@
 
 
 import json
+import threading
 from typing import Optional
 
 import requests
@@ -10,7 +11,19 @@ from singer_sdk.helpers._util import utc_now
 from singer_sdk.streams import Stream as RESTStreamBase
 
 
-class ProxyGoogleAdsAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
+class LockedOAuthAuthenticator(OAuthAuthenticator):
+    """OAuth authenticator safe to share between threads."""
+
+    _refresh_lock = threading.Lock()
+
+    @property
+    def auth_headers(self) -> dict:
+        """Return the auth headers, refreshing the token one thread at a time."""
+        with self._refresh_lock:
+            return super().auth_headers
+
+
+class ProxyGoogleAdsAuthenticator(LockedOAuthAuthenticator, metaclass=SingletonMeta):
     """API Authenticator for Proxy OAuth 2.0 flows."""
 
     def __init__(
@@ -71,7 +84,7 @@ class ProxyGoogleAdsAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
 
 # The SingletonMeta metaclass makes your streams reuse the same authenticator instance.
 # If this behaviour interferes with your use-case, you can remove the metaclass.
-class GoogleAdsAuthenticator(OAuthAuthenticator, metaclass=SingletonMeta):
+class GoogleAdsAuthenticator(LockedOAuthAuthenticator, metaclass=SingletonMeta):
     """Authenticator class for GoogleAds."""
 
     @property
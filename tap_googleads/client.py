@@ -1,12 +1,21 @@
 """REST client handling, including GoogleAdsStream base class."""
 
+import json
+import threading
 from pathlib import Path
-from typing import Any, Dict, Optional
+from queue import Queue
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, Optional, cast
+from urllib.parse import quote_plus
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
+import jsonpath_ng
+import orjson
+from jsonpath_ng.ext import parse as parse_jsonpath
 from memoization import cached
 
-from singer_sdk.helpers.jsonpath import extract_jsonpath
+from singer_sdk import Tap
 from singer_sdk.streams import RESTStream
 from singer_sdk.authenticators import OAuthAuthenticator
 from datetime import datetime, timedelta
@@ -14,9 +23,71 @@ from dateutil import parser
 
 from tap_googleads.auth import GoogleAdsAuthenticator, ProxyGoogleAdsAuthenticator
 
+if TYPE_CHECKING:
+    from tap_googleads.tap import TapGoogleAds
+
 
 SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 
+# Default bound on API requests in flight at once, to stay inside API quota.
+MAX_CONCURRENT_REQUESTS = 8
+# Records buffered per prefetched stream before its worker waits for the tap.
+# This does not bound the memory of a prefetch: the waiting worker also holds
+# the decoded page it is reading, so only a few streams are prefetched at once.
+PREFETCH_BUFFER_SIZE = 1000
+
+_END_OF_RECORDS = object()
+
+
+@cached
+def request_slots(limit: int) -> threading.BoundedSemaphore:
+    """Return the semaphore shared by all requests sent under `limit`."""
+    return threading.BoundedSemaphore(limit)
+
+
+class PrefetchedRecords:
+    """Records of one stream context, requested on a background thread.
+
+    Sibling streams start their requests at the same time so their round-trips
+    overlap, while the records are still handed back in API order.
+    """
+
+    def __init__(self, records: Iterable[dict]) -> None:
+        """Start a worker thread pulling from `records`."""
+        self._records = iter(records)
+        self._queue: Queue = Queue(maxsize=PREFETCH_BUFFER_SIZE)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._worker = threading.Thread(target=self._fill, daemon=True)
+        self._worker.start()
+
+    def _fill(self) -> None:
+        try:
+            while not self._closed:
+                record = next(self._records, _END_OF_RECORDS)
+                if record is _END_OF_RECORDS:
+                    break
+                self._queue.put(record)
+        except BaseException as ex:
+            self._error = ex
+        finally:
+            self._queue.put(_END_OF_RECORDS)
+
+    def __iter__(self) -> Iterator[dict]:
+        try:
+            while True:
+                record = self._queue.get()
+                if record is _END_OF_RECORDS:
+                    if self._error is not None:
+                        raise self._error
+                    return
+                yield record
+        finally:
+            # Unblock the worker if the consumer stops early.
+            self._closed = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+
 
 class GoogleAdsStream(RESTStream):
     """GoogleAds stream class."""
@@ -26,10 +97,43 @@ class GoogleAdsStream(RESTStream):
     records_jsonpath = "$[*]"  # Or override `parse_response`.
     next_page_token_jsonpath = "$.nextPageToken"  # Or override `get_next_page_token`.
     _LOG_REQUEST_METRIC_URLS: bool = True
+    # JSONPath expressions are compiled once per class, not once per page.
+    _records_jsonpath_expr: jsonpath_ng.JSONPath = parse_jsonpath(records_jsonpath)
+    _next_page_token_jsonpath_expr: jsonpath_ng.JSONPath = parse_jsonpath(
+        next_page_token_jsonpath
+    )
+
+    # Schema file of the stream, parsed once per process; see `__init__`.
+    schema_path: Optional[Path] = None
+    _schema_cache: Dict[str, dict] = {}
 
-    _end_date = "'" + datetime.now().strftime("%Y-%m-%d") + "'"
-    _start_date = datetime.now() - timedelta(days=91)
-    _start_date = "'" + _start_date.strftime("%Y-%m-%d") + "'"
+    _session: Optional[requests.Session] = None
+    _session_lock = threading.Lock()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._records_jsonpath_expr = parse_jsonpath(cls.records_jsonpath)
+        if cls.next_page_token_jsonpath:
+            cls._next_page_token_jsonpath_expr = parse_jsonpath(
+                cls.next_page_token_jsonpath
+            )
+
+    def __init__(
+        self,
+        tap: Tap,
+        name: Optional[str] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        path: Optional[str] = None,
+    ) -> None:
+        """Initialize the stream, with no records prefetched yet."""
+        schema_path = self.schema_path if schema is None else None
+        if schema_path is not None:
+            schema = self._load_schema(schema_path)
+        super().__init__(tap=tap, name=name, schema=schema, path=path)
+        if schema_path is not None:
+            self._schema_filepath = schema_path
+        self._customer_id = self.config.get("customer_id")
+        self._prefetched: Dict[str, PrefetchedRecords] = {}
 
     @property
     @cached
@@ -83,6 +187,85 @@ class GoogleAdsStream(RESTStream):
         headers["login-customer-id"] = self.config["customer_id"]
         return headers
 
+    @classmethod
+    def _load_schema(cls, schema_path: Path) -> dict:
+        filepath = str(schema_path)
+        if filepath not in cls._schema_cache:
+            with open(filepath) as f:
+                cls._schema_cache[filepath] = json.load(f)
+        return cls._schema_cache[filepath]
+
+    @classmethod
+    def _shared_session(cls) -> requests.Session:
+        """Return the keep-alive session shared by every stream."""
+        with cls._session_lock:
+            if GoogleAdsStream._session is None:
+                session = requests.Session()
+                # Only connection errors are retried here, HTTP error statuses
+                # are left to the SDK backoff handling.
+                retries = Retry(total=3, read=0, status=0, backoff_factor=0.5)
+                adapter = HTTPAdapter(
+                    pool_connections=16, pool_maxsize=32, max_retries=retries
+                )
+                session.mount("https://", adapter)
+                GoogleAdsStream._session = session
+        return GoogleAdsStream._session
+
+    @property
+    def requests_session(self) -> requests.Session:
+        """Reuse pooled connections across pages and streams."""
+        return self._shared_session()
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Return how many API requests the tap may have in flight at once."""
+        limit = self.config.get("max_concurrent_requests")
+        return MAX_CONCURRENT_REQUESTS if limit is None else limit
+
+    def _request(
+        self, prepared_request: requests.PreparedRequest, context: Optional[dict]
+    ) -> requests.Response:
+        """Send the request once it fits in the tap-wide concurrency budget."""
+        with request_slots(self.max_concurrent_requests):
+            return super()._request(prepared_request, context)
+
+    @staticmethod
+    def _context_key(context: Optional[dict]) -> str:
+        # Contexts may hold lists, e.g. `resourceNames`.
+        return json.dumps(context or {}, sort_keys=True, default=str)
+
+    def prefetch_records(self, context: Optional[dict]) -> None:
+        """Start requesting the records for `context` ahead of the stream sync."""
+        key = self._context_key(context)
+        if key not in self._prefetched:
+            self._prefetched[key] = PrefetchedRecords(super().request_records(context))
+
+    def sync_children_ahead(self, child_context: dict) -> None:
+        """Sync child streams, prefetching the next ones while each is consumed.
+
+        No more than `max_concurrent_requests` child streams are prefetched at
+        a time, including the one being synced, as each holds a decoded page.
+        """
+        child_streams = [
+            child_stream
+            for child_stream in self.child_streams
+            if child_stream.selected or child_stream.has_selected_descendents
+        ]
+        limit = self.max_concurrent_requests
+        for index, child_stream in enumerate(child_streams):
+            for next_stream in child_streams[index : index + limit]:
+                if isinstance(next_stream, GoogleAdsStream):
+                    next_stream.prefetch_records(child_context)
+            child_stream.sync(context=child_context)
+
+    def request_records(self, context: Optional[dict]) -> Iterable[dict]:
+        """Return prefetched records for `context`, or request them now."""
+        prefetched = self._prefetched.pop(self._context_key(context), None)
+        if prefetched is None:
+            yield from super().request_records(context)
+        else:
+            yield from prefetched
+
     def get_next_page_token(
         self, response: requests.Response, previous_token: Optional[Any]
     ) -> Optional[Any]:
@@ -91,16 +274,35 @@ class GoogleAdsStream(RESTStream):
         #       next page. If this is the final page, return "None" to end the
         #       pagination loop.
         if self.next_page_token_jsonpath:
-            all_matches = extract_jsonpath(
-                self.next_page_token_jsonpath, response.json()
+            all_matches = self._next_page_token_jsonpath_expr.find(
+                self._decode_response(response)
             )
             first_match = next(iter(all_matches), None)
-            next_page_token = first_match
+            next_page_token = first_match.value if first_match else None
         else:
             next_page_token = None
 
         return next_page_token
 
+    @staticmethod
+    def _decode_response(response: requests.Response) -> Any:
+        """Decode the JSON body with orjson, once per response."""
+        payload = getattr(response, "_googleads_payload", None)
+        if payload is None:
+            payload = orjson.loads(response.content)
+            response._googleads_payload = payload  # type: ignore[attr-defined]
+        return payload
+
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records."""
+        payload = self._decode_response(response)
+        if self.records_jsonpath == "$.results[*]":
+            # Plain key lookup, skipping the generic JSONPath matcher.
+            yield from payload.get("results", ())
+            return
+        for match in self._records_jsonpath_expr.find(payload):
+            yield match.value
+
     def get_url_params(
         self, context: Optional[dict], next_page_token: Optional[Any]
     ) -> Dict[str, Any]:
@@ -113,18 +315,66 @@ class GoogleAdsStream(RESTStream):
             params["order_by"] = self.replication_key
         return params
 
+    @property
+    def _run_date(self) -> datetime:
+        # Every date window in a run is derived from this one timestamp.
+        return cast("TapGoogleAds", self._tap).run_date
+
     @property
     def start_date(self):
         date = self.config.get("start_date")
         if date:
             date = parser.parse(self.config.get("start_date"))
-            date = "'" + date.strftime("%Y-%m-%d") + "'"
-        return date or self._start_date
+        else:
+            date = self._run_date - timedelta(days=91)
+        return "'" + date.strftime("%Y-%m-%d") + "'"
 
     @property
     def end_date(self):
         date = self.config.get("end_date")
         if date:
             date = parser.parse(self.config.get("end_date"))
-            date = "'" + date.strftime("%Y-%m-%d") + "'"
-        return date or self._end_date
+        else:
+            date = self._run_date
+        return "'" + date.strftime("%Y-%m-%d") + "'"
+
+    @property
+    def performance_start_date(self):
+        """Return the first day of the performance report window."""
+        date = self._run_date - timedelta(
+            days=self.config.get("performance_report_interval_days")
+        )
+        return "'" + date.strftime("%Y-%m-%d") + "'"
+
+
+class GoogleAdsSearchStream(GoogleAdsStream):
+    """Stream of the rows a GAQL query returns from the search endpoint."""
+
+    rest_method = "POST"
+
+    # Built on first use and kept on the instance; see `path`.
+    _path: Optional[str] = None
+
+    @property
+    def gaql(self) -> str:
+        """Return the GAQL query of the stream."""
+        raise NotImplementedError
+
+    @property
+    def path(self) -> str:
+        """Return the search path, with the stream's `gaql` in its query string."""
+        if self._path is None:
+            self._path = (
+                f"/customers/{self._customer_id}/googleAds:search"
+                f"?pageSize=10000&query={self._encoded_query}"
+            )
+        return self._path
+
+    @path.setter
+    def path(self, value: str) -> None:
+        self._path = value
+
+    @property
+    def _encoded_query(self) -> str:
+        """Return the stream's `gaql`, URL-encoded for its search path."""
+        return quote_plus(self.gaql)
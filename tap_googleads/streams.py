@@ -2,11 +2,10 @@
 
 from pathlib import Path
 from typing import Any, Dict, Optional, Union, List, Iterable
-from datetime import datetime, timedelta
 
 from singer_sdk import typing as th  # JSON Schema typing helpers
 
-from tap_googleads.client import GoogleAdsStream
+from tap_googleads.client import GoogleAdsSearchStream, GoogleAdsStream
 from tap_googleads.auth import GoogleAdsAuthenticator
 
 # TODO: Delete this is if not using json files for schema definition
@@ -15,6 +14,11 @@ SCHEMAS_DIR = Path(__file__).parent / Path("./schemas")
 #       - Copy-paste as many times as needed to create multiple stream types.
 
 
+def compact_gaql(query: str) -> str:
+    """Collapse the whitespace of a GAQL query so it URL-encodes compactly."""
+    return " ".join(query.split())
+
+
 class AccessibleCustomers(GoogleAdsStream):
     """Accessible Customers"""
 
@@ -31,7 +35,7 @@ class AccessibleCustomers(GoogleAdsStream):
         return {"resourceNames": ["customers/" + self.config.get("customer_id")]}
 
 
-class CustomerHierarchyStream(GoogleAdsStream):
+class CustomerHierarchyStream(GoogleAdsSearchStream):
     """
     Customer Hierarchy, inspiration from Google here
     https://developers.google.com/google-ads/api/docs/account-management/get-account-hierarchy.
@@ -41,20 +45,10 @@ class CustomerHierarchyStream(GoogleAdsStream):
 
     """
 
-    rest_method = "POST"
-
-    @property
-    def path(self):
-        # Paramas
-        path = f"/customers/{self.config.get('customer_id')}"
-        path = path + "/googleAds:search"
-        path = path + "?pageSize=10000"
-        path = path + f"&query={self.gaql}"
-        return path
-
     @property
     def gaql(self):
-        return """
+        return compact_gaql(
+            """
 	SELECT
           customer_client.client_customer,
           customer_client.level,
@@ -66,6 +60,7 @@ class CustomerHierarchyStream(GoogleAdsStream):
         FROM customer_client
         WHERE customer_client.level <= 1
 	"""
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_customer_hierarchy"
@@ -101,76 +96,61 @@ class CustomerHierarchyStream(GoogleAdsStream):
         Yields:
             One item per (possibly processed) record in the API.
         """
-
         for row in self.request_records(context):
-            row = self.post_process(row, context)
             # Don't search Manager accounts as we can't query them for everything
-            if row["customerClient"]["manager"] == True:
+            if row.get("customerClient", {}).get("manager"):
                 continue
-            yield row
+            yield self.post_process(row, context)
 
     def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
         """Return a context dictionary for child streams."""
         return {"customer_id": self.config.get("customer_id")}
 
+    def _sync_children(self, child_context: dict) -> None:
+        # Report streams are synced one after another; start the requests of
+        # the next few early so the round-trips overlap instead of adding up.
+        self.sync_children_ahead(child_context)
 
-class GeotargetsStream(GoogleAdsStream):
-    """Geotargets, worldwide, constant across all customers"""
 
-    rest_method = "POST"
+class GeotargetsStream(GoogleAdsSearchStream):
+    """Geotargets, worldwide, constant across all customers"""
 
     @property
-    def path(self):
-        # Paramas
-        path = f"/customers/{self.config.get('customer_id')}"
-        path = path + "/googleAds:search"
-        path = path + "?pageSize=10000"
-        path = path + f"&query={self.gaql}"
-        return path
-
-    gaql = """
+    def gaql(self):
+        return compact_gaql(
+            """
     SELECT geo_target_constant.canonical_name, geo_target_constant.country_code, geo_target_constant.id, geo_target_constant.name, geo_target_constant.status, geo_target_constant.target_type FROM geo_target_constant
     """
+        )
+
     records_jsonpath = "$.results[*]"
     name = "stream_geo_target_constant"
     primary_keys = ["geo_target_constant__id"]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "geo_target_constant.json"
+    schema_path = SCHEMAS_DIR / "geo_target_constant.json"
     parent_stream_type = None  # Override ReportsStream default as this is a constant
 
 
-class ReportsStream(GoogleAdsStream):
-    rest_method = "POST"
+class ReportsStream(GoogleAdsSearchStream):
     parent_stream_type = CustomerHierarchyStream
 
-    @property
-    def gaql(self):
-        raise NotImplementedError
-
-    @property
-    def path(self):
-        # Paramas
-        path = f"/customers/{self.config.get('customer_id')}"
-        path = path + "/googleAds:search"
-        path = path + "?pageSize=10000"
-        path = path + f"&query={self.gaql}"
-        return path
-
 
 class CampaignsStream(ReportsStream):
     """Define custom stream."""
 
     @property
     def gaql(self):
-        return """
+        return compact_gaql(
+            """
         SELECT campaign.id, campaign.name FROM campaign ORDER BY campaign.id
         """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_campaign"
     primary_keys = ["campaign__id"]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "campaign.json"
+    schema_path = SCHEMAS_DIR / "campaign.json"
 
 
 class AdGroupsStream(ReportsStream):
@@ -178,7 +158,8 @@ class AdGroupsStream(ReportsStream):
 
     @property
     def gaql(self):
-        return """
+        return compact_gaql(
+            """
        SELECT ad_group.url_custom_parameters, 
        ad_group.type, 
        ad_group.tracking_url_template, 
@@ -207,12 +188,13 @@ class AdGroupsStream(ReportsStream):
        ad_group.ad_rotation_mode
        FROM ad_group 
        """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_adgroups"
     primary_keys = ["ad_group__id", "ad_group__campaign", "ad_group__status"]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "ad_group.json"
+    schema_path = SCHEMAS_DIR / "ad_group.json"
 
 
 class AdsStream(ReportsStream):
@@ -220,7 +202,8 @@ class AdsStream(ReportsStream):
 
     @property
     def gaql(self):
-        return """
+        return compact_gaql(
+            """
        SELECT
        ad_group_ad.ad.type, 
        ad_group_ad.ad.resource_name,
@@ -230,12 +213,13 @@ class AdsStream(ReportsStream):
        campaign.id
        FROM ad_group_ad
        """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_ads"
     primary_keys = ["campaign__id", "ad_group_ad__ad__id"]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "ad.json"
+    schema_path = SCHEMAS_DIR / "ad.json"
 
 
 class AdsPerformance(ReportsStream):
@@ -243,24 +227,22 @@ class AdsPerformance(ReportsStream):
 
     @property
     def gaql(self):
-        start_date = datetime.now() - timedelta(
-            days=self.config.get("performance_report_interval_days")
-        )
-        start_date = "'" + start_date.strftime("%Y-%m-%d") + "'"
-        return f"""
+        return compact_gaql(
+            f"""
         SELECT campaign.name, campaign.id, ad_group_ad.ad.name, ad_group_ad.ad.id, segments.date, metrics.impressions,
         metrics.clicks, metrics.cost_micros, metrics.conversions, metrics.conversions_by_conversion_date,
         metrics.conversions_value, metrics.conversions_value_by_conversion_date, metrics.video_views,
         metrics.video_quartile_p100_rate
         FROM ad_group_ad
-        WHERE segments.date >= {start_date} and segments.date <= {self.end_date}
+        WHERE segments.date >= {self.performance_start_date} and segments.date <= {self.end_date}
         """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_adsperformance"
     primary_keys = ["campaign__id", "ad_group_ad__ad__id", "segments__date"]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "ads_performance.json"
+    schema_path = SCHEMAS_DIR / "ads_performance.json"
 
 
 class AdGroupsPerformance(ReportsStream):
@@ -268,22 +250,22 @@ class AdGroupsPerformance(ReportsStream):
 
     @property
     def gaql(self):
-        start_date = datetime.now() - timedelta(days=self.config.get("performance_report_interval_days"))
-        start_date = "'" + start_date.strftime("%Y-%m-%d") + "'"
-        return f"""
+        return compact_gaql(
+            f"""
         SELECT campaign.name, campaign.id, ad_group.name, ad_group.id, segments.date, metrics.impressions,
         metrics.clicks, metrics.cost_micros, metrics.conversions, metrics.conversions_by_conversion_date,
         metrics.conversions_value, metrics.conversions_value_by_conversion_date, metrics.video_views,
         metrics.video_quartile_p100_rate
         FROM ad_group
-        WHERE segments.date >= {start_date} and segments.date <= {self.end_date}
+        WHERE segments.date >= {self.performance_start_date} and segments.date <= {self.end_date}
         """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_adgroupsperformance"
     primary_keys = ["campaign__id", "ad_group__id", "segments__date"]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "adgroups_performance.json"
+    schema_path = SCHEMAS_DIR / "adgroups_performance.json"
 
 
 class AdGroupsHourlyPerformance(ReportsStream):
@@ -291,22 +273,22 @@ class AdGroupsHourlyPerformance(ReportsStream):
 
     @property
     def gaql(self):
-        start_date = datetime.now() - timedelta(days=self.config.get("performance_report_interval_days"))
-        start_date = "'" + start_date.strftime("%Y-%m-%d") + "'"
-        return f"""
+        return compact_gaql(
+            f"""
         SELECT campaign.name, campaign.id, ad_group.name, ad_group.id, segments.date, segments.hour, metrics.impressions,
         metrics.clicks, metrics.cost_micros, metrics.conversions, metrics.conversions_by_conversion_date,
         metrics.conversions_value, metrics.conversions_value_by_conversion_date, metrics.video_views,
         metrics.video_quartile_p100_rate
         FROM ad_group
-        WHERE segments.date >= {start_date} and segments.date <= {self.end_date}
+        WHERE segments.date >= {self.performance_start_date} and segments.date <= {self.end_date}
         """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_adgroupshourlyperformance"
     primary_keys = ["campaign__id", "ad_group__id", "segments__date", "segments__hour"]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "adgroups_hourly_performance.json"
+    schema_path = SCHEMAS_DIR / "adgroups_hourly_performance.json"
 
 
 class CampaignPerformance(ReportsStream):
@@ -314,16 +296,14 @@ class CampaignPerformance(ReportsStream):
 
     @property
     def gaql(self):
-        start_date = datetime.now() - timedelta(
-            days=self.config.get("performance_report_interval_days")
-        )
-        start_date = "'" + start_date.strftime("%Y-%m-%d") + "'"
-        return f"""
+        return compact_gaql(
+            f"""
     SELECT campaign.name, campaign.id, campaign.status, segments.device, segments.date, metrics.impressions,
     metrics.clicks, metrics.ctr, metrics.average_cpc, metrics.cost_micros, metrics.conversions, metrics.conversions_by_conversion_date,
     metrics.conversions_value, metrics.conversions_value_by_conversion_date, metrics.video_views, metrics.video_quartile_p100_rate
-    FROM campaign WHERE segments.date >= {start_date} and segments.date <= {self.end_date}
+    FROM campaign WHERE segments.date >= {self.performance_start_date} and segments.date <= {self.end_date}
     """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_campaign_performance"
@@ -334,7 +314,7 @@ class CampaignPerformance(ReportsStream):
         "segments__device",
     ]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "campaign_performance.json"
+    schema_path = SCHEMAS_DIR / "campaign_performance.json"
 
 
 class CampaignHourlyPerformance(ReportsStream):
@@ -342,16 +322,14 @@ class CampaignHourlyPerformance(ReportsStream):
 
     @property
     def gaql(self):
-        start_date = datetime.now() - timedelta(
-            days=self.config.get("performance_report_interval_days")
-        )
-        start_date = "'" + start_date.strftime("%Y-%m-%d") + "'"
-        return f"""
+        return compact_gaql(
+            f"""
     SELECT campaign.name, campaign.id, campaign.status, segments.device, segments.date, segments.hour, metrics.impressions,
     metrics.clicks, metrics.ctr, metrics.average_cpc, metrics.cost_micros, metrics.conversions, metrics.conversions_by_conversion_date,
     metrics.conversions_value, metrics.conversions_value_by_conversion_date, metrics.video_views, metrics.video_quartile_p100_rate
-    FROM campaign WHERE segments.date >= {start_date} and segments.date <= {self.end_date}
+    FROM campaign WHERE segments.date >= {self.performance_start_date} and segments.date <= {self.end_date}
     """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_campaign_hourly_performance"
@@ -363,7 +341,7 @@ class CampaignHourlyPerformance(ReportsStream):
         "segments__device",
     ]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "campaign_hourly_performance.json"
+    schema_path = SCHEMAS_DIR / "campaign_hourly_performance.json"
 
 
 class CampaignPerformanceByAgeRangeAndDevice(ReportsStream):
@@ -371,9 +349,11 @@ class CampaignPerformanceByAgeRangeAndDevice(ReportsStream):
 
     @property
     def gaql(self):
-        return f"""
+        return compact_gaql(
+            f"""
     SELECT ad_group_criterion.age_range.type, campaign.name, campaign.status, ad_group.name, segments.date, segments.device, ad_group_criterion.system_serving_status, ad_group_criterion.bid_modifier, metrics.clicks, metrics.impressions, metrics.ctr, metrics.average_cpc, metrics.cost_micros, campaign.advertising_channel_type FROM age_range_view WHERE segments.date >= {self.start_date} and segments.date <= {self.end_date}
     """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_campaign_performance_by_age_range_and_device"
@@ -385,7 +365,7 @@ class CampaignPerformanceByAgeRangeAndDevice(ReportsStream):
         "segments__device",
     ]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "campaign_performance_by_age_range_and_device.json"
+    schema_path = SCHEMAS_DIR / "campaign_performance_by_age_range_and_device.json"
 
 
 class CampaignPerformanceByGenderAndDevice(ReportsStream):
@@ -393,9 +373,11 @@ class CampaignPerformanceByGenderAndDevice(ReportsStream):
 
     @property
     def gaql(self):
-        return f"""
+        return compact_gaql(
+            f"""
     SELECT ad_group_criterion.gender.type, campaign.name, campaign.status, ad_group.name, segments.date, segments.device, ad_group_criterion.system_serving_status, ad_group_criterion.bid_modifier, metrics.clicks, metrics.impressions, metrics.ctr, metrics.average_cpc, metrics.cost_micros, campaign.advertising_channel_type FROM gender_view WHERE segments.date >= {self.start_date} and segments.date <= {self.end_date}
     """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_campaign_performance_by_gender_and_device"
@@ -407,7 +389,7 @@ class CampaignPerformanceByGenderAndDevice(ReportsStream):
         "segments__device",
     ]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "campaign_performance_by_gender_and_device.json"
+    schema_path = SCHEMAS_DIR / "campaign_performance_by_gender_and_device.json"
 
 
 class CampaignPerformanceByLocation(ReportsStream):
@@ -415,9 +397,11 @@ class CampaignPerformanceByLocation(ReportsStream):
 
     @property
     def gaql(self):
-        return f"""
+        return compact_gaql(
+            f"""
     SELECT campaign_criterion.location.geo_target_constant, campaign.name, campaign_criterion.bid_modifier, segments.date, metrics.clicks, metrics.impressions, metrics.ctr, metrics.average_cpc, metrics.cost_micros FROM location_view WHERE segments.date >= {self.start_date} and segments.date <= {self.end_date} AND campaign_criterion.status != 'REMOVED'
     """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_campaign_performance_by_location"
@@ -427,7 +411,7 @@ class CampaignPerformanceByLocation(ReportsStream):
         "segments__date",
     ]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "campaign_performance_by_location.json"
+    schema_path = SCHEMAS_DIR / "campaign_performance_by_location.json"
 
 
 class GeoPerformance(ReportsStream):
@@ -435,7 +419,8 @@ class GeoPerformance(ReportsStream):
 
     @property
     def gaql(self):
-        return f"""
+        return compact_gaql(
+            f"""
     SELECT 
         campaign.name, 
         campaign.status, 
@@ -449,6 +434,7 @@ class GeoPerformance(ReportsStream):
     FROM geographic_view 
     WHERE segments.date >= {self.start_date} and segments.date <= {self.end_date} 
     """
+        )
 
     records_jsonpath = "$.results[*]"
     name = "stream_geo_performance"
@@ -459,4 +445,4 @@ class GeoPerformance(ReportsStream):
         "segments__date",
     ]
     replication_key = None
-    schema_filepath = SCHEMAS_DIR / "geo_performance.json"
+    schema_path = SCHEMAS_DIR / "geo_performance.json"
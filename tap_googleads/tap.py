@@ -1,6 +1,7 @@
 """GoogleAds tap class."""
 
-from typing import List
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Set, Type
 
 from singer_sdk import Tap, Stream
 from singer_sdk import typing as th  # JSON schema typing helpers
@@ -23,7 +24,7 @@ from tap_googleads.streams import (
     GeoPerformance,
 )
 
-STREAM_TYPES = [
+STREAM_TYPES: List[Type[Stream]] = [
     CampaignsStream,
     AdsStream,
     AdGroupsStream,
@@ -41,6 +42,10 @@ STREAM_TYPES = [
     GeoPerformance,
 ]
 
+STREAM_TYPES_BY_NAME: Dict[str, Type[Stream]] = {
+    stream_class.name: stream_class for stream_class in STREAM_TYPES
+}
+
 
 class TapGoogleAds(Tap):
     """GoogleAds tap class."""
@@ -73,8 +78,47 @@ class TapGoogleAds(Tap):
             "performance_report_interval_days",
             th.IntegerType,
         ),
+        th.Property(
+            "max_concurrent_requests",
+            th.IntegerType,
+        ),
     ).to_dict()
+    # The typing helpers can't express bounds; a budget below one request would
+    # stall or break the sync, so reject it when the config is validated.
+    config_jsonschema["properties"]["max_concurrent_requests"]["minimum"] = 1
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the tap, fixing the date its report windows are based on."""
+        # Set before the base class instantiates the streams.
+        self.run_date = datetime.now()
+        super().__init__(*args, **kwargs)
+
+    def _is_selected(self, stream_name: str) -> bool:
+        """Return whether a stream is selected in the input catalog, if any."""
+        if self.input_catalog is None:
+            return True
+        catalog_entry = self.input_catalog.get_stream(stream_name)
+        if catalog_entry is None:
+            return False
+        return catalog_entry.metadata.resolve_selection().get((), True)
 
     def discover_streams(self) -> List[Stream]:
-        """Return a list of discovered streams."""
-        return [stream_class(tap=self) for stream_class in STREAM_TYPES]
+        """Return a list of discovered streams.
+
+        When an input catalog is given, only selected streams and the parent
+        streams they are synced through are instantiated.
+        """
+        stream_names: Set[str] = set()
+        for name, stream_class in STREAM_TYPES_BY_NAME.items():
+            if not self._is_selected(name):
+                continue
+            parent_class: Optional[Type[Stream]] = stream_class
+            while parent_class:
+                stream_names.add(parent_class.name)
+                parent_class = parent_class.parent_stream_type
+
+        return [
+            STREAM_TYPES_BY_NAME[name](tap=self)
+            for name in STREAM_TYPES_BY_NAME
+            if name in stream_names
+        ]
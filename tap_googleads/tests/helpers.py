@@ -0,0 +1,24 @@
+"""Config and responses shared by the tests that don't go through singer."""
+
+import json
+
+import requests
+
+MOCK_CONFIG = {
+    "oauth_credentials": {
+        "client_id": "123",
+        "client_secret": "123",
+        "refresh_token": "123",
+    },
+    "customer_id": "1234",
+    "developer_token": "1234",
+    "performance_report_interval_days": 3,
+}
+
+
+def make_response(payload):
+    """Return a response whose body is `payload` as JSON."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = json.dumps(payload).encode()
+    return response
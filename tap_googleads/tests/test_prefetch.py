@@ -0,0 +1,92 @@
+"""Tests records requested ahead of their stream sync."""
+
+import threading
+import unittest
+from unittest import mock
+
+from tap_googleads.client import GoogleAdsStream, PrefetchedRecords
+from tap_googleads.tap import TapGoogleAds
+from tap_googleads.tests.helpers import MOCK_CONFIG
+
+
+class TestPrefetchedRecords(unittest.TestCase):
+    """Test class for records prefetched on a worker thread"""
+
+    def test_records_keep_their_order(self):
+        records = [{"id": i} for i in range(2500)]
+
+        self.assertEqual(list(PrefetchedRecords(iter(records))), records)
+
+    def test_worker_error_is_raised_after_its_records(self):
+        def failing_records():
+            yield {"id": 1}
+            raise RuntimeError("connection lost")
+
+        prefetched = iter(PrefetchedRecords(failing_records()))
+
+        self.assertEqual(next(prefetched), {"id": 1})
+        with self.assertRaisesRegex(RuntimeError, "connection lost"):
+            next(prefetched)
+
+    def test_worker_stops_when_consumer_closes_early(self):
+        pulled = []
+        blocked = threading.Event()
+
+        def records():
+            for i in range(100):
+                pulled.append(i)
+                if i == 3:
+                    blocked.set()
+                yield {"id": i}
+
+        with mock.patch("tap_googleads.client.PREFETCH_BUFFER_SIZE", 2):
+            prefetched = PrefetchedRecords(records())
+        consumer = iter(prefetched)
+        self.assertEqual(next(consumer), {"id": 0})
+        # Wait for the worker to fill the buffer and block on it.
+        blocked.wait(timeout=5)
+        consumer.close()
+
+        prefetched._worker.join(timeout=5)
+        self.assertFalse(prefetched._worker.is_alive())
+        self.assertLess(len(pulled), 100)
+
+
+class TestSyncChildrenAhead(unittest.TestCase):
+    """Test class for prefetching the next child streams of a parent"""
+
+    def test_prefetch_stays_within_the_request_budget(self):
+        tap = TapGoogleAds(config={**MOCK_CONFIG, "max_concurrent_requests": 2})
+        parent = tap.streams["stream_customer_hierarchy"]
+        prefetched, synced, ahead = [], [], []
+
+        def prefetch_records(stream, context):
+            if stream.name not in prefetched:
+                prefetched.append(stream.name)
+
+        def sync(stream, context):
+            synced.append(stream.name)
+            ahead.append(len(prefetched) - len(synced) + 1)
+
+        with mock.patch.object(
+            GoogleAdsStream, "prefetch_records", prefetch_records
+        ), mock.patch.object(GoogleAdsStream, "sync", sync):
+            parent._sync_children({"customer_id": "1234"})
+
+        children = [child.name for child in parent.child_streams]
+        self.assertGreater(len(children), 2)
+        self.assertEqual(synced, children)
+        self.assertEqual(prefetched, children)
+        self.assertEqual(max(ahead), 2)
+
+
+class TestContextKey(unittest.TestCase):
+    """Test class for the keys of prefetched contexts"""
+
+    def test_contexts_holding_lists_are_keyed(self):
+        key = GoogleAdsStream._context_key({"resourceNames": ["customers/1234"]})
+
+        self.assertEqual(
+            key, GoogleAdsStream._context_key({"resourceNames": ["customers/1234"]})
+        )
+        self.assertEqual(GoogleAdsStream._context_key(None), "{}")
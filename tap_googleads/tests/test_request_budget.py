@@ -0,0 +1,57 @@
+"""Tests the tap-wide bound on API requests in flight."""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from singer_sdk.exceptions import ConfigValidationError
+from singer_sdk.streams import RESTStream
+
+from tap_googleads.client import MAX_CONCURRENT_REQUESTS
+from tap_googleads.tap import TapGoogleAds
+from tap_googleads.tests.helpers import MOCK_CONFIG
+
+
+class TestRequestBudget(unittest.TestCase):
+    """Test class for the max_concurrent_requests setting"""
+
+    def test_budget_defaults_when_unset(self):
+        tap = TapGoogleAds(config=MOCK_CONFIG)
+
+        self.assertEqual(
+            tap.streams["stream_campaign"].max_concurrent_requests,
+            MAX_CONCURRENT_REQUESTS,
+        )
+
+    def test_budget_below_one_is_rejected(self):
+        for limit in (0, -1):
+            with self.subTest(limit=limit), self.assertRaises(ConfigValidationError):
+                TapGoogleAds(config={**MOCK_CONFIG, "max_concurrent_requests": limit})
+
+    def test_requests_in_flight_stay_within_the_budget(self):
+        tap = TapGoogleAds(config={**MOCK_CONFIG, "max_concurrent_requests": 2})
+        streams = [tap.streams["stream_campaign"], tap.streams["stream_ads"]]
+        lock = threading.Lock()
+        in_flight, peaks = [0], []
+
+        def send(stream, prepared_request, context):
+            with lock:
+                in_flight[0] += 1
+                peaks.append(in_flight[0])
+            time.sleep(0.05)
+            with lock:
+                in_flight[0] -= 1
+
+        with mock.patch.object(RESTStream, "_request", send):
+            threads = [
+                threading.Thread(target=streams[i % 2]._request, args=(None, None))
+                for i in range(6)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(timeout=5)
+
+        self.assertEqual(len(peaks), 6)
+        self.assertEqual(max(peaks), 2)
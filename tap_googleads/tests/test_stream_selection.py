@@ -0,0 +1,62 @@
+"""Tests which streams the tap instantiates for an input catalog."""
+
+import unittest
+
+from singer_sdk._singerlib import Catalog
+from singer_sdk.helpers import _catalog
+
+from tap_googleads.tap import STREAM_TYPES, TapGoogleAds
+from tap_googleads.tests.helpers import MOCK_CONFIG
+
+
+def catalog_selecting(stream_names):
+    catalog = Catalog.from_dict(TapGoogleAds(config=MOCK_CONFIG).catalog_dict)
+    _catalog.deselect_all_streams(catalog=catalog)
+    for stream_name in stream_names:
+        _catalog.set_catalog_stream_selected(
+            catalog=catalog,
+            stream_name=stream_name,
+            selected=True,
+        )
+    return catalog.to_dict()
+
+
+class TestStreamSelection(unittest.TestCase):
+    """Test class for instantiating only the selected streams"""
+
+    def test_all_streams_without_catalog(self):
+        tap = TapGoogleAds(config=MOCK_CONFIG)
+
+        self.assertEqual(
+            set(tap.streams), {stream_class.name for stream_class in STREAM_TYPES}
+        )
+
+    def test_selected_stream_keeps_its_parents(self):
+        tap = TapGoogleAds(
+            config=MOCK_CONFIG, catalog=catalog_selecting(["stream_adsperformance"])
+        )
+
+        self.assertEqual(
+            set(tap.streams),
+            {
+                "stream_accessible_customers",
+                "stream_customer_hierarchy",
+                "stream_adsperformance",
+            },
+        )
+        self.assertFalse(tap.streams["stream_customer_hierarchy"].selected)
+        self.assertEqual(
+            [
+                child.name
+                for child in tap.streams["stream_customer_hierarchy"].child_streams
+            ],
+            ["stream_adsperformance"],
+        )
+
+    def test_selected_stream_without_parents(self):
+        tap = TapGoogleAds(
+            config=MOCK_CONFIG,
+            catalog=catalog_selecting(["stream_geo_target_constant"]),
+        )
+
+        self.assertEqual(list(tap.streams), ["stream_geo_target_constant"])
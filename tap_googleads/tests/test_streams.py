@@ -0,0 +1,240 @@
+"""Tests stream parsing, queries and schemas without calling the API."""
+
+import gc
+import json
+import re
+import unittest
+import weakref
+from datetime import datetime
+from unittest import mock
+
+import responses
+
+from tap_googleads.client import GoogleAdsSearchStream, GoogleAdsStream
+from tap_googleads.streams import (
+    AccessibleCustomers,
+    AdsPerformance,
+    CampaignsStream,
+    CustomerHierarchyStream,
+    GeotargetsStream,
+    compact_gaql,
+)
+from tap_googleads.tap import TapGoogleAds
+from tap_googleads.tests.helpers import MOCK_CONFIG, make_response
+
+
+class ResourceNamesStream(GoogleAdsStream):
+    """Stream reading records from a nested path"""
+
+    name = "stream_resource_names"
+    path = "/customers:listAccessibleCustomers"
+    records_jsonpath = "$.resourceNames[*]"
+    next_page_token_jsonpath = None
+    schema = {"properties": {}}
+
+
+class TestParseResponse(unittest.TestCase):
+    """Test class for looking up records in a response page"""
+
+    def setUp(self):
+        self.tap = TapGoogleAds(config=MOCK_CONFIG)
+
+    def test_results_are_looked_up_without_jsonpath(self):
+        stream = CampaignsStream(tap=self.tap)
+        response = make_response({"results": [{"campaign": {"id": "1"}}]})
+
+        with mock.patch.object(CampaignsStream, "_records_jsonpath_expr") as expr:
+            records = list(stream.parse_response(response))
+
+        self.assertEqual(records, [{"campaign": {"id": "1"}}])
+        expr.find.assert_not_called()
+
+    def test_page_without_results_has_no_records(self):
+        stream = CampaignsStream(tap=self.tap)
+
+        self.assertEqual(list(stream.parse_response(make_response({}))), [])
+
+    def test_other_paths_fall_back_to_jsonpath(self):
+        response = make_response({"resourceNames": ["customers/1", "customers/2"]})
+
+        self.assertEqual(
+            list(AccessibleCustomers(tap=self.tap).parse_response(response)),
+            [{"resourceNames": ["customers/1", "customers/2"]}],
+        )
+        self.assertEqual(
+            list(ResourceNamesStream(tap=self.tap).parse_response(response)),
+            ["customers/1", "customers/2"],
+        )
+
+    def test_response_is_decoded_once(self):
+        stream = CampaignsStream(tap=self.tap)
+        response = make_response({"results": [], "nextPageToken": "page2"})
+
+        with mock.patch("tap_googleads.client.orjson.loads", wraps=json.loads) as loads:
+            list(stream.parse_response(response))
+            next_page_token = stream.get_next_page_token(response, None)
+
+        self.assertEqual(next_page_token, "page2")
+        self.assertEqual(loads.call_count, 1)
+
+    @responses.activate
+    def test_largest_reports_follow_pages_by_token(self):
+        responses.add(
+            responses.POST,
+            "https://www.googleapis.com/oauth2/v4/token",
+            json={"access_token": "123", "expires_in": 3622},
+        )
+        responses.add(
+            responses.POST,
+            re.compile(r".*googleAds:search\?pageSize=10000&query=[^&]*$"),
+            json={"results": [{"metrics": {"clicks": "1"}}], "nextPageToken": "page2"},
+        )
+        responses.add(
+            responses.POST,
+            re.compile(r".*googleAds:search.*pageToken=page2"),
+            json={"results": [{"metrics": {"clicks": "2"}}]},
+        )
+        stream = AdsPerformance(tap=self.tap)
+
+        records = list(stream.request_records({"customer_id": "1234"}))
+
+        self.assertEqual(
+            [record["metrics"]["clicks"] for record in records], ["1", "2"]
+        )
+
+
+class TestQueries(unittest.TestCase):
+    """Test class for the GAQL sent in search paths"""
+
+    def test_compact_gaql_collapses_whitespace(self):
+        query = """
+        SELECT campaign.id,
+               campaign.name
+        FROM   campaign	ORDER BY campaign.id
+        """
+
+        self.assertEqual(
+            compact_gaql(query),
+            "SELECT campaign.id, campaign.name FROM campaign ORDER BY campaign.id",
+        )
+
+    def test_compact_gaql_keeps_quoted_dates(self):
+        self.assertEqual(
+            compact_gaql("WHERE  segments.date >= '2022-01-01'\n"),
+            "WHERE segments.date >= '2022-01-01'",
+        )
+
+    def test_path_holds_the_encoded_query(self):
+        stream = CampaignsStream(tap=TapGoogleAds(config=MOCK_CONFIG))
+
+        self.assertEqual(
+            stream.path,
+            "/customers/1234/googleAds:search?pageSize=10000"
+            "&query=SELECT+campaign.id%2C+campaign.name+FROM+campaign"
+            "+ORDER+BY+campaign.id",
+        )
+
+    def test_search_streams_share_one_path_builder(self):
+        stream = GeotargetsStream(tap=TapGoogleAds(config=MOCK_CONFIG))
+
+        self.assertIsInstance(stream, GoogleAdsSearchStream)
+        self.assertTrue(
+            stream.path.startswith(
+                "/customers/1234/googleAds:search?pageSize=10000"
+                "&query=SELECT+geo_target_constant.canonical_name%2C+"
+            )
+        )
+
+    def test_report_window_ends_on_the_tap_run_date(self):
+        tap = TapGoogleAds(config=MOCK_CONFIG)
+        tap.run_date = datetime(2022, 3, 10, 12)
+        stream = AdsPerformance(tap=tap)
+
+        self.assertEqual(stream.performance_start_date, "'2022-03-07'")
+        self.assertEqual(stream.end_date, "'2022-03-10'")
+        self.assertIn("segments.date <= '2022-03-10'", stream.gaql)
+
+    def test_each_tap_has_its_own_run_date(self):
+        first = TapGoogleAds(config=MOCK_CONFIG)
+        first.run_date = datetime(2022, 3, 10)
+        second = TapGoogleAds(config=MOCK_CONFIG)
+
+        self.assertEqual(
+            first.streams["stream_adsperformance"].end_date, "'2022-03-10'"
+        )
+        self.assertEqual(
+            second.streams["stream_adsperformance"].end_date,
+            second.run_date.strftime("'%Y-%m-%d'"),
+        )
+
+
+class TestQueryMemoization(unittest.TestCase):
+    """Test class for search paths memoized on stream instances"""
+
+    def test_path_is_built_once_per_stream(self):
+        stream = CampaignsStream(tap=TapGoogleAds(config=MOCK_CONFIG))
+
+        with mock.patch.object(
+            CampaignsStream,
+            "gaql",
+            new_callable=mock.PropertyMock,
+            return_value="SELECT campaign.id FROM campaign",
+        ) as gaql:
+            first = stream.path
+            second = stream.path
+
+        self.assertIs(first, second)
+        gaql.assert_called_once()
+
+    def test_memoized_path_does_not_keep_the_tap_alive(self):
+        tap = TapGoogleAds(config=MOCK_CONFIG)
+        tap.streams["stream_campaign"].path
+        tap_ref = weakref.ref(tap)
+
+        del tap
+        gc.collect()
+
+        self.assertIsNone(tap_ref())
+
+
+class TestSchemas(unittest.TestCase):
+    """Test class for schemas loaded from the schema files"""
+
+    def setUp(self):
+        self.tap = TapGoogleAds(config=MOCK_CONFIG)
+
+    def test_schema_file_is_parsed_once(self):
+        GoogleAdsStream._schema_cache.clear()
+
+        with mock.patch("tap_googleads.client.json.load", wraps=json.load) as load:
+            first = CampaignsStream(tap=self.tap)
+            second = CampaignsStream(tap=self.tap)
+
+        self.assertEqual(load.call_count, 1)
+        self.assertIs(first.schema, second.schema)
+        self.assertEqual(first.schema_filepath, CampaignsStream.schema_path)
+
+    def test_schema_argument_is_used_over_the_schema_file(self):
+        schema = {"properties": {"id": {"type": "string"}}}
+        stream = CampaignsStream(tap=self.tap, schema=schema)
+
+        self.assertEqual(stream.schema, schema)
+        self.assertIsNone(stream.schema_filepath)
+
+
+class TestCustomerHierarchy(unittest.TestCase):
+    """Test class for the customers report streams are synced for"""
+
+    def test_manager_accounts_are_skipped(self):
+        stream = CustomerHierarchyStream(tap=TapGoogleAds(config=MOCK_CONFIG))
+        rows = [
+            {"customerClient": {"id": "1", "manager": True}},
+            {"customerClient": {"id": "2", "manager": False}},
+            {"customerClient": {"id": "3"}},
+            {},
+        ]
+
+        with mock.patch.object(stream, "request_records", return_value=iter(rows)):
+            records = list(stream.get_records(context=None))
+
+        self.assertEqual(records, rows[1:])